@@ -11,8 +11,13 @@ then pick your favorite to use as the system background.
 
 REQUIREMENTS:
     - Python 3.8+
-    - Pillow (pip install pillow)
+    - Pillow (pip install pillow), or the faster drop-in Pillow-SIMD
+    - NumPy (pip install numpy)
     - Flask (pip install flask)
+    - waitress (optional, pip install waitress) for a multi-threaded server
+    - flask-compress (optional, pip install flask-compress) to compress responses
+    - tqdm (optional, pip install tqdm) for cache warm-up progress
+    - Numba (optional, pip install numba) for multi-core mask application
 
 USAGE:
     1. Place this script in the theme's root directory
@@ -26,14 +31,23 @@ CONFIGURATION:
 ═══════════════════════════════════════════════════════════════════════════
 """
 
-import sys
 import io
-import base64
+import os
+import sys
+import shutil
+import hashlib
+import threading
+import itertools
+import multiprocessing
+from concurrent.futures import CancelledError, Future, ProcessPoolExecutor, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional, List, Dict
+from typing import Optional, List, Dict, Iterator, Tuple
 
 # Check dependencies
+# Tip: Pillow-SIMD is a drop-in replacement with much faster LANCZOS resizing:
+#   pip3 uninstall pillow && pip3 install pillow-simd
 try:
+    import PIL
     from PIL import Image
 except ImportError:
     print("❌ ERROR: Pillow not installed")
@@ -41,12 +55,39 @@ except ImportError:
     sys.exit(1)
 
 try:
-    from flask import Flask, render_template_string, jsonify, request
+    import numpy as np
+except ImportError:
+    print("❌ ERROR: NumPy not installed")
+    print("   Install: pip3 install numpy")
+    sys.exit(1)
+
+try:
+    from flask import Flask, Response, render_template_string, jsonify, request, send_file
 except ImportError:
     print("❌ ERROR: Flask not installed")
     print("   Install: pip3 install flask")
     sys.exit(1)
 
+try:
+    from waitress import serve  # Optional: multi-threaded production server
+except ImportError:
+    serve = None
+
+try:
+    from flask_compress import Compress  # Optional: gzip/brotli for JSON and HTML responses
+except ImportError:
+    Compress = None
+
+try:
+    import numba as nb  # Optional: multi-core alpha kernel for full-size composites
+except ImportError:
+    nb = None
+
+try:
+    from tqdm import tqdm  # Optional: progress bar while warming the preview cache
+except ImportError:
+    tqdm = None
+
 # ═══════════════════════════════════════════════════════════════════════════
 # CONFIGURATION - Adjust these paths for your setup
 # ═══════════════════════════════════════════════════════════════════════════
@@ -55,6 +96,9 @@ except ImportError:
 SCRIPT_DIR = Path(__file__).resolve().parent
 THEME_ROOT = SCRIPT_DIR  # Assumes script is in theme root
 
+# Generated previews are cached here (safe to delete at any time)
+CACHE_DIR = THEME_ROOT / '.artwork_cache'
+
 # ES-DE installation path - common locations tried automatically
 ESDE_PATHS = [
     Path.home() / "ES-DE",
@@ -68,6 +112,9 @@ MEDIA_PRIORITY = ["fanart", "screenshots", "titlescreens", "miximages"]
 # Systems to exclude
 EXCLUDE_SYSTEMS = {'backups', 'backup', 'backups_old', 'ports', 'port', 'hacks', 'hack', 'parts'}
 
+# Worker threads for the waitress server (previews render while others are served)
+SERVER_THREADS = 8
+
 # Artwork directories (relative to theme root)
 ARTWORK_DIR_NAMES = [
     '_inc/systems/artwork',
@@ -82,6 +129,15 @@ ARTWORK_DIR_NAMES = [
 # ═══════════════════════════════════════════════════════════════════════════
 
 IMAGE_EXTS = {".png", ".jpg", ".jpeg"}
+THUMB_SIZE = (220, 220)
+MASK_VARIANT_BOXES = [THUMB_SIZE, (440, 440)]  # Bounding boxes of mask variants prepared at startup
+MAX_PREVIEWS = 120  # Images offered per system; bounds scanning and rendering work
+THUMB_JPEG_QUALITY = 82  # Previews are RGB JPEGs; the slant is applied in the browser
+NUMBA_MIN_PIXELS = 512 * 512  # Below this, thread start-up outweighs a parallel alpha copy
+
+def pillow_simd_active() -> bool:
+    """Check for Pillow-SIMD, which tags its releases as post-releases (e.g. 9.5.0.post1)."""
+    return ".post" in PIL.__version__
 
 def find_esde_root() -> Optional[Path]:
     """Auto-detect ES-DE installation directory."""
@@ -92,24 +148,34 @@ def find_esde_root() -> Optional[Path]:
 
 def find_system_dirs(media_root: Path) -> List[Path]:
     """Get all system directories from media root."""
-    systems = []
-    for child in media_root.iterdir():
-        if child.is_dir():
-            systems.append(child)
-    return systems
-
-def collect_candidate_images(system_dir: Path) -> List[Path]:
-    """Collect game images for a system (priority order: fanart → screenshots → titlescreens → miximages)."""
+    with os.scandir(media_root) as entries:
+        return [Path(entry.path) for entry in entries if entry.is_dir()]
+
+def collect_candidate_images(system_dir: Path) -> Iterator[Path]:
+    """Yield game images for a system (priority order: fanart → screenshots → titlescreens → miximages).
+
+    Lazy, so callers that only need the first few images stop the walk early.
+    """
     for subfolder in MEDIA_PRIORITY:
         folder = system_dir / subfolder
-        images = []
+        found = False
         if folder.is_dir():
-            for img in folder.rglob('*'):
-                if img.suffix.lower() in IMAGE_EXTS and img.is_file():
-                    images.append(img)
-        if images:
-            return images  # Return first non-empty tier
-    return []
+            # scandir walk: DirEntry type checks reuse the directory listing instead of a stat() per file
+            pending = [folder]
+            while pending:
+                try:
+                    entries = os.scandir(pending.pop())
+                except OSError:
+                    continue
+                with entries:
+                    for entry in entries:
+                        if entry.is_dir(follow_symlinks=False):
+                            pending.append(entry.path)
+                        elif os.path.splitext(entry.name)[1].lower() in IMAGE_EXTS and entry.is_file():
+                            found = True
+                            yield Path(entry.path)
+        if found:
+            return  # Only the first non-empty tier is used
 
 def load_mask_alpha(theme_root: Path) -> Optional[Image.Image]:
     """Extract alpha channel from original artwork to use as slant mask."""
@@ -128,41 +194,181 @@ def load_mask_alpha(theme_root: Path) -> Optional[Image.Image]:
         print(f"⚠️  Failed to load mask: {e}")
         return None
 
-def composite(shot: Image.Image, mask_alpha: Image.Image) -> Image.Image:
-    """Composite a screenshot with the slanted alpha mask."""
-    base = shot.convert("RGBA")
-    ow, oh = mask_alpha.size
-    
-    # Resize/crop to mask size
-    if base.size != (ow, oh):
-        bw, bh = base.size
-        base_aspect = bw / bh
-        target_aspect = ow / oh
-        
-        if base_aspect > target_aspect:
-            new_h = oh
-            new_w = int(new_h * base_aspect)
-        else:
-            new_w = ow
-            new_h = int(new_w / base_aspect)
-        
-        scaled = base.resize((new_w, new_h), Image.LANCZOS)
-        left = (new_w - ow) // 2
-        top = (new_h - oh) // 2
-        base = scaled.crop((left, top, left + ow, top + oh))
-    
-    # Apply mask
-    r, g, b, a = base.split()
-    if mask_alpha.size != base.size:
-        mask_alpha = mask_alpha.resize(base.size, Image.LANCZOS)
-    base.putalpha(mask_alpha)
-    return base
-
-def image_to_base64(img: Image.Image) -> str:
-    """Convert PIL Image to base64 for web display."""
+def open_source(img_path: Path, size: tuple) -> Image.Image:
+    """Open a source image, letting JPEGs decode at a reduced scale that still covers size."""
+    img = Image.open(img_path)
+    img.draft('RGB', size)  # No-op for non-JPEG formats
+    return img
+
+def scale_mask(mask_alpha: Image.Image, size: tuple) -> Image.Image:
+    """Shrink the mask to fit within size, keeping its aspect ratio."""
+    small = mask_alpha.copy()
+    small.thumbnail(size, Image.LANCZOS)
+    return small
+
+def build_mask_variants(mask_alpha: Image.Image) -> Dict[Tuple[int, int], Image.Image]:
+    """Resize the mask once for each of MASK_VARIANT_BOXES, keyed by box."""
+    return {box: scale_mask(mask_alpha, box) for box in MASK_VARIANT_BOXES}
+
+if nb is not None:
+    @nb.njit(parallel=True, cache=True, boundscheck=False)
+    def _apply_alpha_jit(rgba, alpha):
+        for y in nb.prange(rgba.shape[0]):
+            for x in range(rgba.shape[1]):
+                rgba[y, x, 3] = alpha[y, x]
+else:
+    _apply_alpha_jit = None
+
+# Numba's default thread pool is not safe for concurrent launches
+_apply_alpha_lock = threading.Lock()
+
+def apply_alpha(rgba: np.ndarray, alpha: np.ndarray):
+    """Copy alpha into the alpha plane of an RGBA array, in place."""
+    if _apply_alpha_jit is not None and alpha.size >= NUMBA_MIN_PIXELS:
+        with _apply_alpha_lock:
+            _apply_alpha_jit(rgba, alpha)
+    else:
+        rgba[..., 3] = alpha
+
+def encode_mask_png(mask_alpha: Image.Image) -> bytes:
+    """Encode the mask as a white RGBA PNG, the form CSS mask-image expects."""
+    img = Image.new("RGBA", mask_alpha.size, "white")
+    img.putalpha(mask_alpha)
     buffered = io.BytesIO()
     img.save(buffered, format="PNG")
-    return base64.b64encode(buffered.getvalue()).decode()
+    return buffered.getvalue()
+
+def fit_to_size(img: Image.Image, size: tuple) -> Image.Image:
+    """Scale an image to cover size, then centre-crop it to exactly size."""
+    ow, oh = size
+    if img.size == (ow, oh):
+        return img
+    
+    bw, bh = img.size
+    base_aspect = bw / bh
+    target_aspect = ow / oh
+    
+    if base_aspect > target_aspect:
+        new_h = oh
+        new_w = int(new_h * base_aspect)
+    else:
+        new_w = ow
+        new_h = int(new_w / base_aspect)
+    
+    scaled = img.resize((new_w, new_h), Image.LANCZOS)
+    left = (new_w - ow) // 2
+    top = (new_h - oh) // 2
+    return scaled.crop((left, top, left + ow, top + oh))
+
+def composite(shot: Image.Image, mask_alpha: Image.Image,
+              mask_np: Optional[np.ndarray] = None) -> Image.Image:
+    """Composite a screenshot with the slanted alpha mask.
+
+    Pass mask_np (the mask as a uint8 array) to skip converting the mask on every call.
+    """
+    base = fit_to_size(shot.convert("RGBA"), mask_alpha.size)
+    
+    # Apply mask in one pass over the alpha plane
+    assert base.size == mask_alpha.size
+    arr = np.array(base)
+    apply_alpha(arr, np.asarray(mask_alpha) if mask_np is None else mask_np)
+    return Image.fromarray(arr)
+
+def cache_key(img_path: Path, size: tuple, mask_digest: str = '') -> str:
+    """Cache key for a source image rendered at size; changes when the file changes.
+
+    Pass mask_digest for outputs that bake in the mask, so a changed slant of
+    the same resolution is not served from the cache.
+    """
+    st = img_path.stat()
+    raw = f"{img_path}|{st.st_mtime_ns}|{st.st_size}|{size}|{mask_digest}"
+    return hashlib.blake2b(raw.encode()).hexdigest()[:16]
+
+def save_atomic(img: Image.Image, out_path: Path, **save_args):
+    """Save into the cache via write-then-rename so concurrent readers never see a partial file."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    tmp_path = CACHE_DIR / f"{out_path.stem}.{os.getpid()}-{threading.get_ident()}.tmp"
+    img.save(tmp_path, **save_args)
+    os.replace(tmp_path, out_path)
+
+def cached_thumbnail(img_path: Path, key: str, size: tuple) -> Path:
+    """Return the cached JPEG preview of an image, generating it on a miss.
+
+    Previews carry no alpha: the browser applies the slant with the shared
+    /api/mask.png, so each thumbnail is a small RGB JPEG.
+    """
+    out_path = CACHE_DIR / f"{key}.jpg"
+    if out_path.is_file():
+        return out_path
+    
+    thumb = fit_to_size(open_source(img_path, size).convert("RGB"), size)
+    save_atomic(thumb, out_path, format="JPEG", quality=THUMB_JPEG_QUALITY)
+    return out_path
+
+def cached_composite(img_path: Path, key: str, mask: Image.Image,
+                     mask_np: Optional[np.ndarray] = None) -> Path:
+    """Return the cached full composite PNG of an image, generating it on a miss."""
+    out_path = CACHE_DIR / f"{key}.png"
+    if out_path.is_file():
+        return out_path
+    
+    comp = composite(open_source(img_path, mask.size), mask, mask_np)
+    save_atomic(comp, out_path, format="PNG")
+    return out_path
+
+# Warm-up state, kept reachable so main() can stop the pool on shutdown
+_warm_pool: Optional[ProcessPoolExecutor] = None
+_warm_futures: List[Future] = []
+_warm_stop = None  # multiprocessing.Event, created with the pool so importing has no side effects
+
+def _init_warm_worker(stop_event, cache_dir: str):
+    """Worker process initializer: share the stop flag and cache location."""
+    global _warm_stop, CACHE_DIR
+    _warm_stop = stop_event
+    CACHE_DIR = Path(cache_dir)
+
+def warm_system_cache(system_dir: str, thumb_size: tuple) -> int:
+    """Worker process: render missing thumbnails for one system, return how many were rendered."""
+    rendered = 0
+    for img_path in itertools.islice(collect_candidate_images(Path(system_dir)), MAX_PREVIEWS):
+        if _warm_stop.is_set():
+            break
+        try:
+            key = cache_key(img_path, thumb_size)
+            if not (CACHE_DIR / f"{key}.jpg").is_file():
+                cached_thumbnail(img_path, key, thumb_size)
+                rendered += 1
+        except Exception:
+            continue  # Reported when the image is requested from the UI
+    return rendered
+
+def warm_preview_cache(systems: List[Dict], thumb_size: tuple):
+    """Pre-render thumbnails for all systems across a process pool."""
+    global _warm_pool, _warm_futures, _warm_stop
+    _warm_stop = multiprocessing.Event()
+    try:
+        with ProcessPoolExecutor(max_workers=os.cpu_count(), initializer=_init_warm_worker,
+                                 initargs=(_warm_stop, str(CACHE_DIR))) as pool:
+            _warm_pool = pool
+            _warm_futures = [pool.submit(warm_system_cache, s['path'], thumb_size) for s in systems]
+            done = as_completed(_warm_futures)
+            if tqdm:
+                done = tqdm(done, total=len(_warm_futures), desc="Warming previews", unit="system")
+            rendered = sum(f.result() for f in done)
+        print(f"✅ Preview cache ready ({rendered} new thumbnails)")
+    except CancelledError:
+        pass  # Server shut down during warm-up
+    except Exception as e:
+        print(f"⚠️  Preview warm-up stopped: {e}")
+
+def stop_warm_up():
+    """Cancel pending warm-up jobs and let running ones finish their current image."""
+    if _warm_stop is not None:
+        _warm_stop.set()
+    for future in _warm_futures:
+        future.cancel()
+    if _warm_pool is not None:
+        _warm_pool.shutdown(wait=False)
 
 # ═══════════════════════════════════════════════════════════════════════════
 # WEB APPLICATION
@@ -170,12 +376,36 @@ def image_to_base64(img: Image.Image) -> str:
 
 app = Flask(__name__)
 app.config['SECRET_KEY'] = 'esde-artwork-picker-2025'
+app.config['COMPRESS_MIN_SIZE'] = 512
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+if Compress:
+    Compress(app)
 
 # Global state
 systems_cache: List[Dict] = []
-mask_alpha: Optional[Image.Image] = None
+systems_by_name: Dict[str, Path] = {}
+mask_alpha: Optional[Image.Image] = None  # Full resolution, used for saving
+mask_alpha_np: Optional[np.ndarray] = None  # Contiguous copy of mask_alpha, passed to composite()
+mask_variants: Dict[Tuple[int, int], Image.Image] = {}  # Downscaled masks for sizing previews
+thumb_mask: Optional[Image.Image] = None  # Fits THUMB_SIZE, applied to previews by the browser
+mask_png: bytes = b''  # Encoded once for /api/mask.png
+mask_digest: str = ''  # Hash of mask_alpha's pixels, part of full composite cache keys
 media_root: Optional[Path] = None
 artwork_dirs: List[Path] = []
+candidates_cache: Dict[str, List[Path]] = {}
+
+def pick_mask(box: Tuple[int, int]) -> Image.Image:
+    """Prepared mask fitting within box, resized on demand for boxes not in MASK_VARIANT_BOXES."""
+    mask = mask_variants.get(box)
+    return mask if mask is not None else scale_mask(mask_alpha, box)
+
+def system_candidates(system_name: str, system_path: Path) -> List[Path]:
+    """First MAX_PREVIEWS candidate images for a system, scanned once and reused until /api/refresh."""
+    candidates = candidates_cache.get(system_name)
+    if candidates is None:
+        candidates = list(itertools.islice(collect_candidate_images(system_path), MAX_PREVIEWS))
+        candidates_cache[system_name] = candidates
+    return candidates
 
 HTML_TEMPLATE = """
 <!DOCTYPE html>
@@ -323,7 +553,7 @@ HTML_TEMPLATE = """
             border: 3px solid transparent;
             box-shadow: 0 4px 15px rgba(0, 0, 0, 0.3);
         }
-        .preview-card:hover {
+        .preview-card:not(.disabled):hover {
             background: rgba(54, 54, 54, 0.9);
             transform: translateY(-6px) scale(1.02);
             box-shadow: 0 8px 25px rgba(0, 0, 0, 0.5);
@@ -340,6 +570,23 @@ HTML_TEMPLATE = """
             border-radius: 8px;
             display: block;
             box-shadow: 0 2px 10px rgba(0, 0, 0, 0.3);
+            -webkit-mask-image: url('/api/mask.png');
+            mask-image: url('/api/mask.png');
+            -webkit-mask-size: 100% 100%;
+            mask-size: 100% 100%;
+        }
+        .preview-card.disabled {
+            cursor: not-allowed;
+            opacity: 0.5;
+        }
+        .preview-card .unreadable {
+            display: flex;
+            align-items: center;
+            justify-content: center;
+            border-radius: 8px;
+            background: rgba(0, 0, 0, 0.3);
+            font-size: 13px;
+            color: #999;
         }
         .preview-card .name {
             margin-top: 12px;
@@ -401,6 +648,7 @@ HTML_TEMPLATE = """
         let currentSystem = null;
         let selectedIndex = null;
         let previews = [];
+        let thumbSize = [220, 220];
 
         fetch('/api/systems')
             .then(r => r.json())
@@ -409,10 +657,20 @@ HTML_TEMPLATE = """
                 renderSystems();
             });
 
+        // One delegated listener per list instead of a handler on every item
+        document.getElementById('systems-list').addEventListener('click', e => {
+            const item = e.target.closest('.system-item');
+            if (item) selectSystem(+item.dataset.index);
+        });
+        document.getElementById('previews').addEventListener('click', e => {
+            const card = e.target.closest('.preview-card');
+            if (card && !card.classList.contains('disabled')) selectPreview(+card.dataset.index);
+        });
+
         function renderSystems() {
             const list = document.getElementById('systems-list');
             list.innerHTML = systems.map((sys, i) => 
-                `<div class="system-item" onclick="selectSystem(${i})">${sys.name}</div>`
+                `<div class="system-item" data-index="${i}">${sys.name}</div>`
             ).join('');
         }
 
@@ -432,16 +690,23 @@ HTML_TEMPLATE = """
                 .then(r => r.json())
                 .then(data => {
                     previews = data.previews;
+                    thumbSize = data.thumb_size;
                     renderPreviews();
-                    document.getElementById('status').textContent = `${currentSystem.name}: ${previews.length} images available • Click to select`;
+                    document.getElementById('status').textContent = `${currentSystem.name}: ${previews.filter(p => p.url).length} images available • Click to select`;
                 });
         }
 
         function renderPreviews() {
             const container = document.getElementById('previews');
-            container.innerHTML = previews.map((prev, i) => `
-                <div class="preview-card" onclick="selectPreview(${i})">
-                    <img src="data:image/png;base64,${prev.thumbnail}" alt="${prev.name}">
+            container.innerHTML = previews.map((prev, i) => prev.url ? `
+                <div class="preview-card" data-index="${i}">
+                    <img src="${prev.url}" alt="${prev.name}" loading="lazy" decoding="async"
+                         width="${thumbSize[0]}" height="${thumbSize[1]}">
+                    <div class="name">${prev.name}</div>
+                </div>
+            ` : `
+                <div class="preview-card disabled" data-index="${i}">
+                    <div class="unreadable" style="aspect-ratio: ${thumbSize[0]} / ${thumbSize[1]}">⚠️ Unreadable image</div>
                     <div class="name">${prev.name}</div>
                 </div>
             `).join('');
@@ -449,9 +714,8 @@ HTML_TEMPLATE = """
 
         function selectPreview(index) {
             selectedIndex = index;
-            document.querySelectorAll('.preview-card').forEach((el, i) => {
-                el.classList.toggle('selected', i === index);
-            });
+            document.querySelector('.preview-card.selected')?.classList.remove('selected');
+            document.querySelector(`.preview-card[data-index="${index}"]`).classList.add('selected');
             document.getElementById('save-btn').disabled = false;
             document.getElementById('status').textContent = `${currentSystem.name}: Selected "${previews[index].name}"`;
         }
@@ -498,36 +762,91 @@ def api_systems():
 
 @app.route('/api/previews/<system_name>')
 def api_previews(system_name):
-    system_path = None
-    for sys in systems_cache:
-        if sys['name'] == system_name:
-            system_path = Path(sys['path'])
-            break
+    system_path = systems_by_name.get(system_name)
     
     if not system_path:
         return jsonify({'error': 'System not found'}), 404
     
-    candidates = collect_candidate_images(system_path)
-    previews = []
-    
+    candidates = system_candidates(system_name, system_path)
+    keys = []
     for img_path in candidates:
         try:
-            source_img = Image.open(img_path)
-            comp = composite(source_img, mask_alpha)
-            thumb = comp.copy()
-            thumb.thumbnail((220, 220), Image.LANCZOS)
-            thumb_b64 = image_to_base64(thumb)
-            
-            previews.append({
-                'name': img_path.stem[:45],
-                'thumbnail': thumb_b64,
-                'path': str(img_path),
-            })
+            keys.append(cache_key(img_path, thumb_mask.size))
+        except OSError:
+            keys.append('')
+    
+    # Response only changes when a source image (or the mask) changes
+    etag = hashlib.blake2b('|'.join(keys).encode()).hexdigest()[:16]
+    # flask-compress tags compressed responses with the encoding, e.g. "<etag>:gzip"
+    if any(tag.split(':')[0] == etag for tag in request.if_none_match.as_set()):
+        not_modified = Response(status=304)
+        not_modified.set_etag(etag)
+        return not_modified
+    
+    # Render thumbnails the warm-up has not reached yet; Pillow releases the GIL
+    # while decoding and resizing, so threads overlap well
+    def _render(item) -> Optional[Path]:
+        img_path, key = item
+        try:
+            return cached_thumbnail(img_path, key, thumb_mask.size)
         except Exception as e:
             print(f"⚠️  Failed to load {img_path.name}: {e}")
-            continue
+            return None
+    
+    missing = [(p, k) for p, k in zip(candidates, keys) if k and not (CACHE_DIR / f"{k}.jpg").is_file()]
+    failed = set()
+    if missing:
+        with ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1)) as ex:
+            failed = {p for (p, _), thumb in zip(missing, ex.map(_render, missing)) if thumb is None}
+    
+    # Thumbnails are served by /api/thumb; the key busts browser caches. Unreadable
+    # images keep their slot (indices must match /api/save) but get no URL
+    previews = [{
+        'name': img_path.stem[:45],
+        'url': f"/api/thumb/{system_name}/{idx}.jpg?v={key}" if key and img_path not in failed else None,
+        'path': str(img_path),
+    } for idx, (img_path, key) in enumerate(zip(candidates, keys))]
+    
+    response = jsonify({'previews': previews, 'thumb_size': thumb_mask.size})
+    response.set_etag(etag)
+    return response
+
+@app.route('/api/thumb/<system_name>/<int:idx>.jpg')
+def api_thumb(system_name, idx):
+    system_path = systems_by_name.get(system_name)
+    
+    if not system_path:
+        return jsonify({'error': 'System not found'}), 404
+    
+    candidates = system_candidates(system_name, system_path)
+    if idx >= len(candidates):
+        return jsonify({'error': 'Image not found'}), 404
+    
+    img_path = candidates[idx]
+    try:
+        key = cache_key(img_path, thumb_mask.size)
+    except OSError:
+        return jsonify({'error': 'Image not found'}), 404
+    # The response is cached forever, so only answer for the image the URL was issued for
+    if request.args.get('v') != key:
+        return jsonify({'error': 'Stale preview URL'}), 404
+
+    try:
+        thumb_path = cached_thumbnail(img_path, key, thumb_mask.size)
+    except Exception as e:
+        print(f"⚠️  Failed to load {img_path.name}: {e}")
+        return jsonify({'error': 'Failed to render preview'}), 500
     
-    return jsonify({'previews': previews})
+    response = send_file(thumb_path, mimetype='image/jpeg', max_age=31536000, etag=True, conditional=True)
+    response.cache_control.public = True
+    response.cache_control.immutable = True
+    return response
+
+@app.route('/api/mask.png')
+def api_mask():
+    response = Response(mask_png, mimetype='image/png')
+    response.set_etag(hashlib.blake2b(mask_png).hexdigest()[:16])
+    return response.make_conditional(request)
 
 @app.route('/api/save', methods=['POST'])
 def api_save():
@@ -538,29 +857,26 @@ def api_save():
     if not system_name or index is None:
         return jsonify({'success': False}), 400
     
-    system_path = None
-    for sys in systems_cache:
-        if sys['name'] == system_name:
-            system_path = Path(sys['path'])
-            break
+    system_path = systems_by_name.get(system_name)
     
     if not system_path:
         return jsonify({'success': False}), 404
     
-    candidates = collect_candidate_images(system_path)
+    candidates = system_candidates(system_name, system_path)
     if index >= len(candidates):
         return jsonify({'success': False}), 400
     
     try:
-        source_img = Image.open(candidates[index])
-        comp = composite(source_img, mask_alpha)
+        img_path = candidates[index]
+        full_cached = cached_composite(img_path, cache_key(img_path, mask_alpha.size, mask_digest),
+                                       mask_alpha, mask_alpha_np)
         
         saved = []
         for adir in artwork_dirs:
             if not adir.is_dir():
                 continue
             out_path = adir / f"{system_name}.png"
-            comp.save(out_path)
+            shutil.copyfile(full_cached, out_path)
             saved.append(out_path.parent.name)
         
         return jsonify({'success': True, 'saved': saved})
@@ -568,12 +884,18 @@ def api_save():
         print(f"❌ Save error: {e}")
         return jsonify({'success': False, 'error': str(e)}), 500
 
+@app.route('/api/refresh', methods=['POST'])
+def api_refresh():
+    """Forget scanned image lists so new or removed media is picked up."""
+    candidates_cache.clear()
+    return jsonify({'success': True})
+
 # ═══════════════════════════════════════════════════════════════════════════
 # MAIN ENTRY POINT
 # ═══════════════════════════════════════════════════════════════════════════
 
 def main():
-    global systems_cache, mask_alpha, media_root, artwork_dirs
+    global systems_cache, systems_by_name, mask_alpha, mask_alpha_np, mask_variants, thumb_mask, mask_png, mask_digest, media_root, artwork_dirs
     
     print("\n" + "═" * 70)
     print("  ES-DE Art Book Next Theme - Artwork Picker")
@@ -585,6 +907,13 @@ def main():
         print("   Place this script in the theme's root folder")
         sys.exit(1)
     
+    # Report image backend
+    if pillow_simd_active():
+        print(f"✅ Pillow-SIMD {PIL.__version__} detected")
+    else:
+        print(f"💡 Using Pillow {PIL.__version__} - Pillow-SIMD resizes several times faster")
+        print("   Install: pip3 uninstall pillow && pip3 install pillow-simd")
+    
     # Find ES-DE installation
     print("🔍 Locating ES-DE installation...")
     esde_root = find_esde_root()
@@ -605,6 +934,11 @@ def main():
     if not mask_alpha:
         print("❌ ERROR: Could not load mask alpha from theme artwork")
         sys.exit(1)
+    mask_digest = hashlib.blake2b(mask_alpha.tobytes()).hexdigest()[:16]
+    mask_alpha_np = np.ascontiguousarray(mask_alpha)
+    mask_variants = build_mask_variants(mask_alpha)
+    thumb_mask = pick_mask(THUMB_SIZE)
+    mask_png = encode_mask_png(pick_mask((2 * THUMB_SIZE[0], 2 * THUMB_SIZE[1])))  # Crisp edges on HiDPI screens
     print(f"✅ Mask loaded: {mask_alpha.size}")
     
     # Discover artwork directories
@@ -619,8 +953,13 @@ def main():
     all_systems = find_system_dirs(media_root)
     filtered = [s for s in all_systems if s.name.lower() not in EXCLUDE_SYSTEMS]
     systems_cache = [{'name': s.name, 'path': str(s)} for s in sorted(filtered, key=lambda x: x.name)]
+    systems_by_name = {s.name: s for s in filtered}
     print(f"✅ Found: {len(systems_cache)} systems")
     
+    # Render previews in the background while the user browses
+    print("🔥 Warming preview cache in the background...")
+    threading.Thread(target=warm_preview_cache, args=(systems_cache, thumb_mask.size), daemon=True).start()
+    
     # Start server
     print("\n" + "═" * 70)
     print("  🚀 SERVER READY")
@@ -628,12 +967,20 @@ def main():
     print("\n  Open in your browser:")
     print("    👉 http://localhost:5000\n")
     print("  Press Ctrl+C to stop the server")
+    if not serve:
+        print("  Tip: pip3 install waitress for a faster multi-threaded server")
     print("═" * 70 + "\n")
     
     try:
-        app.run(debug=False, host='127.0.0.1', port=5000)
+        if serve:
+            serve(app, host='127.0.0.1', port=5000, threads=SERVER_THREADS)
+        else:
+            app.run(debug=False, host='127.0.0.1', port=5000, threaded=True)
     except KeyboardInterrupt:
-        print("\n\n✨ Server stopped. Goodbye!\n")
+        pass  # Flask's dev server raises on Ctrl+C; waitress handles it and returns
+    finally:
+        stop_warm_up()
+    print("\n\n✨ Server stopped. Goodbye!\n")
 
 if __name__ == '__main__':
     main()